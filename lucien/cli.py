@@ -4,21 +4,32 @@ Lucien CLI using Typer.
 Command-line interface for all pipeline stages.
 """
 
+import cProfile
+import functools
 import gc
 import json
 import logging
 import multiprocessing
+import os
+import pstats
+import queue
 import re
+import signal
+import subprocess
 import sys
 import threading
 import time
+import traceback
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
 from rich.console import Console, Group
 from rich.table import Table
 from rich.live import Live
+from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.text import Text
 
@@ -34,6 +45,100 @@ app = typer.Typer(
 )
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging(level: str) -> None:
+    """Route lucien's log records through the Rich console, so they print above Live displays."""
+    package_logger = logging.getLogger("lucien")
+    if not package_logger.handlers:
+        package_logger.addHandler(RichHandler(console=console, show_time=False, show_path=False))
+    package_logger.setLevel(level)
+
+
+# Patterns used to categorize extraction errors (compiled once, matched per skipped/failed file)
+_SKIP_EXT_RE = re.compile(r'Extension (\.\w+)')
+_LAST_ERR_RE = re.compile(r'Last error: (.+)')
+
+
+def _skip_list_reason(error_msg: str) -> str:
+    """Extract extension from "Extension .jpg in skip list"."""
+    match = _SKIP_EXT_RE.search(error_msg)
+    if match:
+        return f"Skipped: {match.group(1)} in skip list"
+    return "Skipped: Extension in skip list"
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on (respects taskset/cgroup affinity where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS
+        return os.cpu_count() or 1
+
+
+# vm_stat output (macOS): "(page size of 16384 bytes)" header and "Pages free:   1234." lines
+_VM_STAT_PAGE_SIZE_RE = re.compile(r'page size of (\d+) bytes')
+_VM_STAT_PAGES_RE = re.compile(r'^Pages (free|inactive|speculative):\s+(\d+)\.', re.MULTILINE)
+
+
+def _available_memory_gb() -> Optional[float]:
+    """Memory available to new processes in GB (reclaimable cache included), or None if unknown.
+
+    Linux reports this as MemAvailable; on macOS it is the free, inactive and speculative pages
+    from vm_stat. Anywhere else, or if the figure can't be read, returns None.
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/meminfo") as meminfo:
+                for line in meminfo:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) / (1024 ** 2)  # Reported in kB
+        elif sys.platform == "darwin":
+            output = subprocess.run(["vm_stat"], capture_output=True, text=True, check=True, timeout=5).stdout
+            page_size_match = _VM_STAT_PAGE_SIZE_RE.search(output)
+            if page_size_match is None:
+                return None
+            pages = {name: int(count) for name, count in _VM_STAT_PAGES_RE.findall(output)}
+            available_pages = pages["free"] + pages["inactive"] + pages.get("speculative", 0)
+            return available_pages * int(page_size_match.group(1)) / (1024 ** 3)
+    except (OSError, ValueError, KeyError, subprocess.SubprocessError):
+        pass
+    return None
+
+
+def _all_failed_reason(error_msg: str) -> str:
+    """Extract the last extractor error from an "All extractors failed" message."""
+    match = _LAST_ERR_RE.search(error_msg)
+    if match:
+        last_error = match.group(1)[:60]  # Truncate long errors
+        return f"Failed: {last_error}"
+    return "Failed: All extractors failed"
+
+
+# Ordered (substring, reason) rules for categorizing error messages; the first match wins.
+# A reason may be a callable that derives the text from the full message.
+_REASON_RULES = (
+    ("in skip list", _skip_list_reason),
+    ("No extractor available", "Skipped: No extractor available"),
+    ("Docling timed out", "Failed: Docling timeout (hung on complex PDF)"),
+    ("All extractors failed", _all_failed_reason),
+    ("Worker hung", "Failed: Worker timeout"),
+    ("Worker error", "Failed: Worker error"),
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _categorize_reason(error_msg: Optional[str]) -> str:
+    """Categorize an error message into a displayable reason (cached: error messages repeat a lot)."""
+    if not error_msg:
+        return "Unknown"
+    # Categorize common patterns
+    for needle, reason in _REASON_RULES:
+        if needle in error_msg:
+            return reason(error_msg) if callable(reason) else reason
+    # Truncate long error messages
+    return f"Failed: {error_msg[:60]}"
 
 
 def version_callback(value: bool):
@@ -169,11 +274,14 @@ def stats(
         table.add_column("Metric", style="cyan")
         table.add_column("Count", justify="right", style="green")
 
-        table.add_row("Total Files", str(stats["total_files"]))
-        table.add_row("Successful Extractions", str(stats["total_extractions"]))
-        table.add_row("Total Labels", str(stats["total_labels"]))
-        table.add_row("Total Plans", str(stats["total_plans"]))
-        table.add_row("Total Runs", str(stats["total_runs"]))
+        for label, key in (
+            ("Total Files", "total_files"),
+            ("Successful Extractions", "total_extractions"),
+            ("Total Labels", "total_labels"),
+            ("Total Plans", "total_plans"),
+            ("Total Runs", "total_runs"),
+        ):
+            table.add_row(label, f"{stats[key]:,}")
 
         console.print()
         console.print(table)
@@ -263,13 +371,18 @@ def extract(
         None,
         "--workers",
         "-j",
-        help="Number of parallel workers (default: number of CPU cores)",
+        help="Number of parallel workers (default: number of available CPU cores)",
     ),
     no_docling: bool = typer.Option(
         False,
         "--no-docling",
         help="Disable Docling extractor (reduces memory usage from ~10GB to ~100MB per worker)",
     ),
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        help="Profile the parent's result loop and write cProfile stats to this file",
+    ),
 ):
     """
     Phase 1: Extract text from documents.
@@ -278,6 +391,8 @@ def extract(
     Docling (primary), pypdf (fallback), and plain text extractors.
     """
     try:
+        # Deferred so other commands don't pay for loading the extractors (docling, chardet, pyobjc)
+        from .extract_worker import PoolResult, extract_file_for_pool, init_pool_worker
         from .pipeline import ExtractionPipeline
 
         # Load config
@@ -296,6 +411,8 @@ def extract(
         if no_docling:
             config.extraction.use_docling = False
 
+        _configure_logging(config.log_level)
+
         # Ensure directories exist
         config.ensure_directories()
 
@@ -314,15 +431,15 @@ def extract(
         # Initialize pipeline
         pipeline = ExtractionPipeline(config, database)
 
-        # Count files to process (for progress bar)
-        total_files = pipeline.count_files_for_extraction(force=force)
+        # Count files to process (for progress bar) and diagnostic counts in one query
+        counts = pipeline.count_extraction_candidates(force=force)
+        total_files = counts["to_extract"]
         if limit:
             total_files = min(total_files, limit)
 
-        # Get diagnostic counts
-        previously_extracted = database.count_previously_extracted_files()
-        skip_extension_count = database.count_files_with_skip_extensions(config.extraction.skip_extensions)
-        total_in_db = database.get_stats()["total_files"]
+        previously_extracted = counts["previously_extracted"]
+        skip_extension_count = counts["skipped_by_extension"]
+        total_in_db = counts["total_files"]
 
         # Show diagnostic information
         console.print(f"\n[bold cyan]Database Summary:[/]")
@@ -337,19 +454,32 @@ def extract(
             sys.exit(0)
 
         # Determine number of workers
-        import os
+        available_cpus = _available_cpus()
         if workers is None:
-            workers = os.cpu_count() or 1
-        workers = max(1, min(workers, os.cpu_count() or 1))  # Clamp between 1 and CPU count
+            workers = available_cpus
+            if config.extraction.use_docling:
+                # Docling needs ~2-5GB per worker; oversubscribing memory just trades throughput for swap
+                available_memory_gb = _available_memory_gb()
+                if available_memory_gb is not None:
+                    workers = min(workers, int(available_memory_gb // 5))
+        workers = max(1, min(workers, available_cpus))  # Clamp between 1 and available CPUs
 
         console.print(f"\n[cyan]Parallel workers: {workers}[/]")
         if force:
             console.print("[yellow]Force mode: Re-extracting all files (ignoring previous extractions)[/]")
 
+        # Restart workers after N files to prevent memory accumulation
+        # This is critical for Docling which loads heavy ML models
+        # Workers grow from ~2GB -> ~5GB over 20 files, so restart frequently
+        maxtasksperchild = config.extraction.max_tasks_per_worker
+        if maxtasksperchild is None:
+            # Can process more files without Docling
+            maxtasksperchild = 20 if config.extraction.use_docling else 200
+
         # Show extractor configuration
         if config.extraction.use_docling:
             console.print("[cyan]Using Docling (high quality, ~2-5GB RAM per worker)[/]")
-            console.print("[cyan]Workers restart every 20 files to prevent memory accumulation[/]")
+            console.print(f"[cyan]Workers restart every {maxtasksperchild} files to prevent memory accumulation[/]")
             console.print("[yellow]Note: Complex PDFs may take 5-10 minutes to process[/]")
         else:
             console.print("[yellow]Docling disabled - using pypdf/vision-ocr (~100MB RAM per worker)[/]")
@@ -358,81 +488,33 @@ def extract(
 
         # Extract files with progress bar (process in parallel subprocesses for memory isolation)
         # Track detailed stats with reasons
-        stats = {
-            "success": 0,
-            "success_methods": {},  # method -> count
-            "failed": 0,
-            "failed_reasons": {},  # reason -> count
-            "skipped": 0,
-            "skipped_reasons": {},  # reason -> count
-        }
+        stats = {"success": 0, "failed": 0, "skipped": 0}  # status -> count
+        success_methods: Counter[str] = Counter()  # method -> count
+        failed_reasons: Counter[str] = Counter()  # reason -> count
+        skipped_reasons: Counter[str] = Counter()  # reason -> count
         batch_size = 100  # Process 100 files at a time
 
-        def categorize_reason(error_msg: str) -> str:
-            """Categorize an error message into a displayable reason."""
-            if not error_msg:
-                return "Unknown"
-            # Categorize common patterns
-            if "in skip list" in error_msg:
-                # Extract extension from "Extension .jpg in skip list"
-                match = re.search(r'Extension (\.\w+)', error_msg)
-                if match:
-                    return f"Skipped: {match.group(1)} in skip list"
-                return "Skipped: Extension in skip list"
-            elif "No extractor available" in error_msg:
-                return "Skipped: No extractor available"
-            elif "Docling timed out" in error_msg:
-                return "Failed: Docling timeout (hung on complex PDF)"
-            elif "All extractors failed" in error_msg:
-                # Try to extract the actual error
-                match = re.search(r'Last error: (.+)', error_msg)
-                if match:
-                    last_error = match.group(1)[:60]  # Truncate long errors
-                    return f"Failed: {last_error}"
-                return "Failed: All extractors failed"
-            elif "Worker hung" in error_msg:
-                return "Failed: Worker timeout"
-            elif "Worker error" in error_msg:
-                return "Failed: Worker error"
-            else:
-                # Truncate long error messages
-                return f"Failed: {error_msg[:60]}"
-        
-        # Import worker function
-        from .extract_worker import extract_file_worker
-
-        # Prepare config paths for subprocess workers
-        config_file_path = None
-        if config_file:
-            config_file_path = config_file
-        elif hasattr(config, '_config_file_path'):
-            config_file_path = config._config_file_path
-
-        # Set up multiprocessing
-        import multiprocessing
-        if multiprocessing.get_start_method(allow_none=True) != 'spawn':
-            try:
-                multiprocessing.set_start_method('spawn', force=True)
-            except RuntimeError:
-                pass  # Already set
-
-        # Import pool worker function
-        from .extract_worker import extract_file_for_pool
-        
-        # Test that worker function is importable and callable
-        try:
-            # Just verify it's a function
-            if not callable(extract_file_for_pool):
-                raise ValueError("extract_file_for_pool is not callable")
-        except Exception as e:
-            console.print(f"[bold red]Error: Failed to import worker function: {e}[/]")
-            sys.exit(1)
+        # Set up multiprocessing. On Linux workers come from a forkserver that has already imported
+        # the extraction stack, so each new (or recycled, see maxtasksperchild) worker is a cheap
+        # fork instead of a fresh interpreter re-importing docling/torch. macOS keeps spawn: forking
+        # after the pyobjc Vision/Quartz frameworks are loaded is not safe
+        if sys.platform.startswith("linux"):
+            mp_context = multiprocessing.get_context("forkserver")
+            mp_context.set_forkserver_preload(["lucien.extract_worker"])
+        else:
+            mp_context = multiprocessing.get_context("spawn")
 
         # Create worker status display
-        worker_status = {}  # worker_id -> (file_name, status, elapsed_time)
-
-        def render_worker_status() -> Panel:
-            """Render current status of all workers."""
+        WORKER_IDLE, WORKER_PROCESSING, WORKER_COMPLETED, WORKER_HUNG = range(4)
+        STATUS_NAMES = ("idle", "processing", "completed", "hung")
+        STATUS_COLORS = ("dim", "yellow", "green", "red")
+        # worker_slot -> (display_name, status, start_time, end_time or None); the name is
+        # truncated to fit the File column once, when the worker picks the file up
+        worker_status: list[tuple[str, int, float, Optional[float]]] = [("--", WORKER_IDLE, 0.0, None)] * workers
+        SLOW_WORKER_THRESHOLD = 120.0  # Show warning if a file takes > 2 minutes
+
+        def render_worker_status(status_lines: list) -> Panel:
+            """Render current status of all workers, followed by the overall stats lines."""
             # Create table showing worker status
             table = Table.grid(padding=(0, 2))
             table.add_column("Worker", style="cyan", width=8)
@@ -440,23 +522,13 @@ def extract(
             table.add_column("File", style="white", width=55)
             table.add_column("Time", style="dim", width=10)
 
-            # Show status for each worker slot
-            for worker_id in range(workers):
-                if worker_id in worker_status:
-                    file_name, status, elapsed = worker_status[worker_id]
-                    # Normalize status - remove "(slow)" suffix and handle it via color
-                    is_slow = "(slow)" in status
-                    base_status = status.replace(" (slow)", "").replace("(slow)", "")
-
-                    status_color = {
-                        "processing": "yellow" if not is_slow else "yellow3",
-                        "completed": "green",
-                        "hung": "red",
-                        "idle": "dim"
-                    }.get(base_status, "white")
-
-                    # Truncate file name to fit column
-                    display_name = file_name[:53] + "..." if len(file_name) > 53 else file_name
+            # Show status for each worker slot (elapsed times are computed here, at render time)
+            now = time.monotonic()
+            for worker_id, (display_name, status, start_time, end_time) in enumerate(worker_status):
+                if status != WORKER_IDLE:
+                    elapsed = (end_time or now) - start_time
+                    is_slow = status == WORKER_PROCESSING and elapsed > SLOW_WORKER_THRESHOLD
+                    status_color = "yellow3" if is_slow else STATUS_COLORS[status]
 
                     # Format time with indicator for slow tasks
                     time_str = f"{elapsed:.1f}s" if elapsed else "--"
@@ -465,16 +537,45 @@ def extract(
 
                     table.add_row(
                         f"#{worker_id+1}",
-                        f"[{status_color}]{base_status}[/]",
+                        f"[{status_color}]{STATUS_NAMES[status]}[/]",
                         display_name,
                         time_str
                     )
                 else:
                     table.add_row(f"#{worker_id+1}", "[dim]idle[/]", "--", "--")
 
-            # Overall stats with breakdowns
+            return Panel(
+                Group(
+                    table,
+                    Text(""),  # Spacing
+                    *status_lines
+                ),
+                title="Worker Status",
+                border_style="cyan"
+            )
+
+        # Stats text only changes when a result is recorded, so it is rebuilt lazily
+        # (record_result clears the cache) instead of on every render
+        stats_lines_cache: dict[str, Optional[tuple[Text, list[Text]]]] = {"lines": None}
+        # Live renders on its own refresh thread; this guards stats and the cache against
+        # record_result updating them mid-render
+        stats_lock = threading.Lock()
+
+        def render_stats_lines() -> tuple[Text, list[Text]]:
+            """Render the progress line and overall stats with breakdowns, reusing the cache if stats haven't changed."""
+            with stats_lock:
+                lines = stats_lines_cache["lines"]
+                if lines is None:
+                    lines = stats_lines_cache["lines"] = build_stats_lines()
+                return lines
+
+        def build_stats_lines() -> tuple[Text, list[Text]]:
+            """Build the progress line and stats lines from the current stats (caller holds stats_lock)."""
+
+            # Overall stats with breakdowns (shared by the progress line and the status panel)
             total_completed = stats["success"] + stats["failed"] + stats["skipped"]
             overall_pct = (total_completed / total_files * 100) if total_files > 0 else 0
+            progress_text = Text(f"Progress: {total_completed:,}/{total_files:,} ({overall_pct:.1f}%)", style="cyan")
 
             # Build detailed status text
             status_lines = [
@@ -483,341 +584,269 @@ def extract(
             ]
 
             # Show top 3 success methods if any
-            if stats["success_methods"]:
-                top_methods = sorted(stats["success_methods"].items(), key=lambda x: x[1], reverse=True)[:3]
+            if success_methods:
+                top_methods = success_methods.most_common(3)
                 methods_str = ", ".join([f"{method}: {count}" for method, count in top_methods])
                 status_lines.append(Text(f"  Methods: {methods_str}", style="dim green"))
 
             # Show top 3 skip reasons if any
-            if stats["skipped_reasons"]:
-                top_skips = sorted(stats["skipped_reasons"].items(), key=lambda x: x[1], reverse=True)[:3]
+            if skipped_reasons:
+                top_skips = skipped_reasons.most_common(3)
                 skips_str = ", ".join([f"{reason.replace('Skipped: ', '')}: {count}" for reason, count in top_skips])
                 status_lines.append(Text(f"  Skip: {skips_str}", style="dim yellow"))
 
             # Show top 3 fail reasons if any
-            if stats["failed_reasons"]:
-                top_fails = sorted(stats["failed_reasons"].items(), key=lambda x: x[1], reverse=True)[:3]
+            if failed_reasons:
+                top_fails = failed_reasons.most_common(3)
                 fails_str = ", ".join([f"{reason.replace('Failed: ', '')[:30]}: {count}" for reason, count in top_fails])
                 status_lines.append(Text(f"  Fail: {fails_str}", style="dim red"))
 
-            return Panel(
-                Group(
-                    table,
-                    Text(""),  # Spacing
-                    *status_lines
-                ),
-                title="Worker Status",
-                border_style="cyan"
-            )
+            return progress_text, status_lines
         
         # Use Live to show both progress and worker status together
         def render_display() -> Group:
             """Render both progress and worker status."""
-            # Create a simple progress indicator
-            total_completed = stats["success"] + stats["failed"] + stats["skipped"]
-            overall_pct = (total_completed / total_files * 100) if total_files > 0 else 0
-            progress_text = Text(f"Progress: {total_completed:,}/{total_files:,} ({overall_pct:.1f}%)", style="cyan")
-            
+            progress_text, status_lines = render_stats_lines()
             return Group(
                 progress_text,
-                render_worker_status()
+                render_worker_status(status_lines)
             )
         
-        with Live(render_display(), console=console, refresh_per_second=4, screen=False) as live:
-            # Use a continuous queue model: create ONE pool that persists, feed tasks continuously
-            # Workers pick up new tasks as soon as they finish, maximizing utilization
-            import queue as queue_module
-            from collections import deque
-
-            # Restart workers after N files to prevent memory accumulation
-            # This is critical for Docling which loads heavy ML models
-            # Workers grow from ~2GB -> ~5GB over 20 files, so restart frequently
-            # The timeout is long enough (10 min) that slow PDFs won't be interrupted
-            if config.extraction.use_docling:
-                maxtasksperchild = 20  # Restart worker after 20 files to keep memory in check
-            else:
-                maxtasksperchild = 200  # Can process more files without Docling
-
-            with multiprocessing.Pool(processes=workers, maxtasksperchild=maxtasksperchild) as pool:
-                # Track active jobs: async_result -> (file_info, submission_time, worker_slot)
-                active_jobs = {}  # Map async_result -> (file_info, submission_time, worker_slot)
-                worker_assignments = {}  # Map async_result -> worker_slot
-                next_worker_slot = 0
+        # Live calls render_display from its refresh thread at 2Hz, so the result loop never spends
+        # time building Rich objects and the display stays current while the loop waits on results.
+        # Without a terminal (CI, log pipes, nohup) Live can't redraw in place, so skip the refresh
+        # thread and print a plain progress line every PLAIN_PROGRESS_INTERVAL files instead
+        interactive = console.is_terminal
+        PLAIN_PROGRESS_INTERVAL = 100
+        with Live(console=console, refresh_per_second=2, screen=False, auto_refresh=interactive,
+                  get_renderable=render_display) as live:
+            # Stream tasks into the pool with imap_unordered: the pool's task handler pulls new work
+            # lazily from the generator and results come back in completion order, so the main
+            # process blocks on the next result instead of polling every job
+            # Workers report ("start"/"done", pid, file_id, file_name) events on this queue so the
+            # display and hang detection know which file each pool process is working on
+            status_queue = mp_context.Queue()
+
+            with mp_context.Pool(
+                processes=workers,
+                maxtasksperchild=maxtasksperchild,
+                initializer=init_pool_worker,
+                initargs=(status_queue, config),  # Workers get the parsed config, overrides included
+            ) as pool:
+                in_flight: dict[int, tuple[str, float, int]] = {}  # file_id -> (file_name, start_time, worker_slot)
+                slot_pids: list[Optional[int]] = [None] * workers  # worker_slot -> pid of the pool process shown there
+                pid_slots: dict[int, int] = {}  # pid -> worker_slot (reverse of slot_pids)
+                abandoned: set[int] = set()  # file_ids given up on as hung (late results are ignored)
                 results_received = 0
+                dispatched = 0
+                dispatch_done = False
                 # Docling can be slow on complex PDFs (OCR, tables, etc.)
                 # 10 minutes should be enough for even the most complex documents
                 HUNG_WORKER_TIMEOUT = 600.0  # 10 minutes - if a worker takes longer, consider it hung
-                
-                # Create a queue of pending tasks (file_info dicts)
-                task_queue = deque()
-                
-                # Function to submit next task to an available worker
-                def submit_next_task():
-                    """Submit the next task from the queue to the pool."""
-                    if not task_queue:
-                        return None
-                    
-                    file_info = task_queue.popleft()
-                    pool_arg = (file_info, config_file_path, config.index_db, config.extracted_text_dir)
-                    async_result = pool.apply_async(extract_file_for_pool, args=(pool_arg,))
-                    
-                    # Assign to a worker slot (round-robin)
-                    nonlocal next_worker_slot
-                    worker_slot = next_worker_slot % workers
-                    next_worker_slot += 1
-                    submission_time = time.time()
-                    
-                    active_jobs[async_result] = (file_info, submission_time, worker_slot)
-                    worker_assignments[async_result] = worker_slot
-                    
-                    # Update worker status to show it's processing
-                    file_path = Path(file_info["path"])
-                    worker_status[worker_slot] = (file_path.name, "processing", 0.0)
-                    
-                    return async_result
-                
-                # Pre-fill queue with initial batch and start workers
-                # Load enough tasks to keep workers busy (2-3x worker count)
-                initial_queue_size = workers * 3
-                batch_iterator = pipeline.iter_files_for_extraction(force=force, limit=limit, batch_size=batch_size)
-                
-                # Load initial batches into queue
-                for batch in batch_iterator:
-                    for file_info in batch:
-                        task_queue.append(file_info)
-                    if len(task_queue) >= initial_queue_size:
-                        break
-                
-                # Start initial workers (fill all worker slots)
-                for _ in range(min(workers, len(task_queue))):
-                    submit_next_task()
-                
-                # Main processing loop: continuously check for completed jobs and submit new ones
-                loop_iterations = 0
-                batch_start_time = time.time()
-                batches_loaded = 1
-                
-                while active_jobs or task_queue:
-                    loop_iterations += 1
-                    current_time = time.time()
-                    
-                    # Load more batches if queue is getting low (keep it at least 2x workers)
-                    if len(task_queue) < workers * 2:
-                        try:
-                            batch = next(batch_iterator)
-                            for file_info in batch:
-                                task_queue.append(file_info)
-                            batches_loaded += 1
-                        except StopIteration:
-                            pass  # No more batches, continue processing what's in queue
-                    
-                    # Check for completed results and immediately assign new work
-                    completed_results = []
-                    hung_workers = []
-                    
-                    for async_result in list(active_jobs.keys()):
-                        if async_result.ready():
-                            try:
-                                file_info, result_dict = async_result.get(timeout=0)
-                                completed_results.append((async_result, file_info, result_dict))
-                            except multiprocessing.TimeoutError:
-                                pass  # Shouldn't happen with timeout=0
-                            except Exception as e:
-                                # Only log actual errors, not routine exceptions
-                                import sys
-                                if "Error retrieving result" not in str(e):
-                                    print(f"ERROR: Error getting result: {type(e).__name__}: {e}", file=sys.stderr, flush=True)
-                                # Mark as failed
-                                if async_result in active_jobs:
-                                    file_info, _, _ = active_jobs[async_result]
-                                    result_dict = {
-                                        "status": "failed",
-                                        "method": "unknown",
-                                        "output_path": None,
-                                        "error": f"Error retrieving result: {type(e).__name__}: {e}",
-                                    }
-                                    completed_results.append((async_result, file_info, result_dict))
-                        else:
-                            # Check if this worker is hung (taking too long) and update elapsed time
-                            if async_result in active_jobs:
-                                file_info, submission_time, worker_slot = active_jobs[async_result]
-                                elapsed = current_time - submission_time
-                                
-                                # Update worker status with current elapsed time
-                                if async_result in worker_assignments:
-                                    file_path = Path(file_info["path"])
-                                    # Mark as hung if taking too long (but still processing)
-                                    if elapsed > HUNG_WORKER_TIMEOUT:
-                                        worker_status[worker_slot] = (file_path.name, "hung", elapsed)
-                                        hung_workers.append((async_result, file_info, elapsed))
-                                    elif elapsed > 120.0:  # Show warning if taking > 2 minutes
-                                        worker_status[worker_slot] = (file_path.name, "processing (slow)", elapsed)
-                                    else:
-                                        worker_status[worker_slot] = (file_path.name, "processing", elapsed)
-                    
-                    # Handle hung workers - mark as failed and free up the worker slot
-                    for async_result, file_info, elapsed in hung_workers:
-                        file_path = Path(file_info["path"])
-                        # Only log if truly hung (not just slow)
-                        if elapsed > HUNG_WORKER_TIMEOUT:
-                            import sys
-                            print(f"WARNING: Worker hung on {file_path.name[:80]} after {elapsed:.1f}s - marking as failed", file=sys.stderr, flush=True)
-                        # Try to get the result one more time (non-blocking)
+
+                def task_stream():
+                    """Yield pool arguments for every file that needs extraction.
+
+                    Consumed by the pool's task-handler thread, so paging through the database
+                    overlaps with extraction instead of blocking the result loop.
+                    """
+                    nonlocal dispatched, dispatch_done
+                    for batch in pipeline.iter_files_for_extraction(force=force, limit=limit, batch_size=batch_size):
+                        for file_info in batch:
+                            dispatched += 1
+                            yield file_info
+                    dispatch_done = True
+
+                def slot_for_pid(pid: int) -> int:
+                    """Map a pool process to a display slot, reusing slots of retired processes."""
+                    slot = pid_slots.get(pid)
+                    if slot is not None:
+                        return slot
+                    busy_slots = {slot for _, _, slot in in_flight.values()}
+                    free_slots = [slot for slot in range(workers) if slot not in busy_slots]
+                    # Prefer slots never used; otherwise take over an idle slot (its process
+                    # was restarted by maxtasksperchild)
+                    unused = [slot for slot in free_slots if slot_pids[slot] is None]
+                    slot = (unused or free_slots or [0])[0]
+                    previous_pid = slot_pids[slot]
+                    if previous_pid is not None:
+                        pid_slots.pop(previous_pid, None)
+                    slot_pids[slot] = pid
+                    pid_slots[pid] = slot
+                    return slot
+
+                # Guards in_flight, slot_pids/pid_slots and worker_status, which the status listener
+                # thread updates while the main loop checks for hung workers
+                status_lock = threading.Lock()
+
+                def listen_status_events() -> None:
+                    """Apply worker start/done events as they arrive (runs on a background thread)."""
+                    while True:
+                        event = status_queue.get()
+                        if event is None:
+                            return
+                        kind, pid, file_id, file_name = event
+                        current_time = time.monotonic()
+                        with status_lock:
+                            if kind == "start":
+                                if file_id in abandoned:
+                                    continue
+                                worker_slot = slot_for_pid(pid)
+                                in_flight[file_id] = (file_name, current_time, worker_slot)
+                                # Truncate file name to fit column
+                                display_name = file_name[:53] + "..." if len(file_name) > 53 else file_name
+                                worker_status[worker_slot] = (display_name, WORKER_PROCESSING, current_time, None)
+                            elif file_id in in_flight:
+                                _, start_time, worker_slot = in_flight.pop(file_id)
+                                display_name = worker_status[worker_slot][0]
+                                worker_status[worker_slot] = (display_name, WORKER_COMPLETED, start_time, current_time)
+
+                # Extraction records are written by a background thread in batches (one transaction
+                # per flush) so the result loop never waits on SQLite; None tells it to finish up.
+                # Records are (file_id, run_id, method, status, output_path, error) tuples
+                record_queue: queue.Queue[Optional[tuple[int, int, str, str, Optional[str], Optional[str]]]] = \
+                    queue.Queue(maxsize=2000)
+                FLUSH_BATCH_SIZE = 200
+                FLUSH_INTERVAL = 2.0  # seconds
+
+                def write_records() -> None:
+                    """Write queued records once a batch fills or the flush interval passes (runs on a background thread)."""
+                    pending_records = []
+                    last_flush_time = time.monotonic()
+                    stopping = False
+                    while not stopping:
                         try:
-                            if async_result.ready():
-                                file_info, result_dict = async_result.get(timeout=0)
-                                completed_results.append((async_result, file_info, result_dict))
+                            record = record_queue.get(timeout=FLUSH_INTERVAL)
+                            if record is None:
+                                stopping = True
                             else:
-                                # Worker is truly hung - mark as failed
-                                result_dict = {
-                                    "status": "failed",
-                                    "method": "unknown",
-                                    "output_path": None,
-                                    "error": f"Worker hung after {elapsed:.1f}s",
-                                }
-                                completed_results.append((async_result, file_info, result_dict))
-                        except Exception as e:
-                            # Mark as failed
-                            result_dict = {
-                                "status": "failed",
-                                "method": "unknown",
-                                "output_path": None,
-                                "error": f"Worker error: {type(e).__name__}: {e}",
-                            }
-                            completed_results.append((async_result, file_info, result_dict))
-                    
-                    # Process completed results and immediately assign new work
-                    for async_result, file_info, result_dict in completed_results:
-                        results_received += 1
-                        file_path = Path(file_info["path"])
-                        
-                        # Free up the worker slot and remove from active jobs
-                        if async_result in worker_assignments:
-                            worker_slot = worker_assignments[async_result]
-                            if async_result in active_jobs:
-                                _, submission_time, _ = active_jobs[async_result]
-                                elapsed = current_time - submission_time
-                                worker_status[worker_slot] = (file_path.name, "completed", elapsed)
-                            del worker_assignments[async_result]
-                        if async_result in active_jobs:
-                            del active_jobs[async_result]
-                        
-                        # Immediately assign new work to this worker slot if tasks are available
-                        if task_queue:
-                            submit_next_task()
-                        
-                        # Removed verbose debug logging to avoid screen tear with Rich display
-                        
-                        # Record result in database
-                        try:
-                            database.record_extraction(
-                                file_id=file_info["id"],
-                                run_id=run_id,
-                                method=result_dict["method"],
-                                status=result_dict["status"],
-                                output_path=result_dict["output_path"],
-                                error=result_dict["error"]
-                            )
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Failed to record extraction for {file_path.name}: {e}[/]")
+                                pending_records.append(record)
+                        except queue.Empty:
+                            pass
 
-                        # Update stats with reasons
-                        status = result_dict["status"]
+                        now = time.monotonic()
+                        if pending_records and (stopping or len(pending_records) >= FLUSH_BATCH_SIZE
+                                                or now - last_flush_time >= FLUSH_INTERVAL):
+                            try:
+                                written = database.record_extractions_bulk(pending_records)
+                                if written < len(pending_records):
+                                    logger.warning("Dropped %d invalid extraction records", len(pending_records) - written)
+                            except Exception as e:
+                                logger.warning("Failed to record %d extractions: %s", len(pending_records), e)
+                            pending_records = []
+                            last_flush_time = now
+                    database.close()
+
+                # Bound once; record_result runs for every file
+                put_record = record_queue.put
+                reason_counters = {"skipped": skipped_reasons, "failed": failed_reasons}
+
+                def record_result(result: PoolResult) -> None:
+                    """Queue a finished file for the database writer and update stats."""
+                    status = result.status
+                    put_record((result.file_id, run_id, result.method, status, result.output_path, result.error))
+                    reason = _categorize_reason(result.error) if status in reason_counters else None
+
+                    # Update stats with reasons
+                    with stats_lock:
                         stats[status] += 1
+                        stats_lines_cache["lines"] = None
 
                         if status == "success":
-                            method = result_dict["method"]
-                            stats["success_methods"][method] = stats["success_methods"].get(method, 0) + 1
-                        elif status == "skipped":
-                            reason = categorize_reason(result_dict.get("error", "Unknown"))
-                            stats["skipped_reasons"][reason] = stats["skipped_reasons"].get(reason, 0) + 1
-                        elif status == "failed":
-                            reason = categorize_reason(result_dict.get("error", "Unknown"))
-                            stats["failed_reasons"][reason] = stats["failed_reasons"].get(reason, 0) + 1
-                    
-                    # Update worker status display (less frequently to avoid redraw issues)
-                    if completed_results or loop_iterations % 10 == 0:  # Update when results arrive or every 10 iterations
-                        live.update(render_display())
-                    
-                    # Sleep to allow workers to make progress and avoid busy-waiting
-                    if completed_results:
-                        time.sleep(0.05)  # Short sleep when processing results
-                    else:
-                        time.sleep(0.1)  # Short sleep when waiting for results
-                
-                # Wait for any remaining active jobs to complete
-                while active_jobs:
-                    current_time = time.time()
-                    completed_results = []
-                    
-                    for async_result in list(active_jobs.keys()):
-                        if async_result.ready():
+                            success_methods[result.method] += 1
+                        elif reason is not None:
+                            reason_counters[status][reason] += 1
+
+                def check_in_flight(current_time: float) -> None:
+                    """Give up on workers that exceeded the hang timeout."""
+                    hung_files = []
+                    with status_lock:
+                        for file_id, (file_name, start_time, worker_slot) in in_flight.items():
+                            elapsed = current_time - start_time
+                            if elapsed > HUNG_WORKER_TIMEOUT:
+                                display_name = worker_status[worker_slot][0]
+                                worker_status[worker_slot] = (display_name, WORKER_HUNG, start_time, current_time)
+                                hung_pid = slot_pids[worker_slot]
+                                hung_files.append((file_id, file_name, elapsed, hung_pid))
+                                if hung_pid is not None:
+                                    pid_slots.pop(hung_pid, None)
+                                slot_pids[worker_slot] = None
+                        # Remove after the scan rather than iterating over a copy of in_flight
+                        for file_id, _, _, _ in hung_files:
+                            del in_flight[file_id]
+                            abandoned.add(file_id)
+
+                    for file_id, file_name, elapsed, hung_pid in hung_files:
+                        logger.warning("Worker hung on %s after %.1fs - marking as failed", file_name[:80], elapsed)
+                        # Terminate the stuck process; the pool starts a replacement for the slot
+                        if hung_pid is not None:
                             try:
-                                file_info, result_dict = async_result.get(timeout=0)
-                                completed_results.append((async_result, file_info, result_dict))
-                            except Exception as e:
-                                # Only log actual errors
-                                import sys
-                                print(f"ERROR: Error getting final result: {type(e).__name__}: {e}", file=sys.stderr, flush=True)
-                                if async_result in active_jobs:
-                                    file_info, _, _ = active_jobs[async_result]
-                                    result_dict = {
-                                        "status": "failed",
-                                        "method": "unknown",
-                                        "output_path": None,
-                                        "error": f"Error retrieving result: {type(e).__name__}: {e}",
-                                    }
-                                    completed_results.append((async_result, file_info, result_dict))
-                    
-                    # Process completed results
-                    for async_result, file_info, result_dict in completed_results:
-                        results_received += 1
-                        file_path = Path(file_info["path"])
-                        
-                        if async_result in worker_assignments:
-                            worker_slot = worker_assignments[async_result]
-                            if async_result in active_jobs:
-                                _, submission_time, _ = active_jobs[async_result]
-                                elapsed = current_time - submission_time
-                                worker_status[worker_slot] = (file_path.name, "completed", elapsed)
-                            del worker_assignments[async_result]
-                        if async_result in active_jobs:
-                            del active_jobs[async_result]
-                        
-                        # Record result in database
+                                os.kill(hung_pid, signal.SIGTERM)
+                            except OSError:
+                                pass  # Already exited
+                        record_result(PoolResult(file_id, "failed", "unknown", None, f"Worker hung after {elapsed:.1f}s"))
+
+                status_thread = threading.Thread(target=listen_status_events, daemon=True)
+                status_thread.start()
+                writer_thread = threading.Thread(target=write_records, daemon=True)
+                writer_thread.start()
+                results = pool.imap_unordered(extract_file_for_pool, task_stream(), chunksize=1)
+
+                # The result loop's garbage (display objects, result tuples) is short-lived and freed
+                # by refcounting; move everything already loaded out of the collector's reach and
+                # make full collections rare so they don't stall the loop while it runs
+                gc_thresholds = gc.get_threshold()
+                gc.freeze()
+                gc.set_threshold(gc_thresholds[0], gc_thresholds[1], 1_000_000)
+                # Extraction itself runs in the workers; this only shows where the parent's
+                # dispatch and bookkeeping time goes (Live's render thread isn't included)
+                profiler = cProfile.Profile() if profile else None
+                if profiler:
+                    profiler.enable()
+                try:
+                    while True:
+                        # Every dispatched file is accounted for; only abandoned (hung) tasks remain
+                        if dispatch_done and results_received + len(abandoned) >= dispatched:
+                            break
+
                         try:
-                            database.record_extraction(
-                                file_id=file_info["id"],
-                                run_id=run_id,
-                                method=result_dict["method"],
-                                status=result_dict["status"],
-                                output_path=result_dict["output_path"],
-                                error=result_dict["error"]
-                            )
+                            result = results.next(timeout=0.25)
+                        except multiprocessing.TimeoutError:
+                            check_in_flight(time.monotonic())
+                            continue
+                        except StopIteration:
+                            break
                         except Exception as e:
-                            console.print(f"[yellow]Warning: Failed to record extraction for {file_path.name}: {e}[/]")
-
-                        # Update stats with reasons
-                        status = result_dict["status"]
-                        stats[status] += 1
+                            # extract_file_for_pool catches extraction errors itself, so this is a pool-level
+                            # failure (e.g. an unpicklable result) that can't be attributed to a file
+                            logger.error("Error getting result: %s: %s", type(e).__name__, e)
+                            results_received += 1
+                            continue
+
+                        if result.file_id in abandoned:
+                            continue  # Already recorded as hung
+                        results_received += 1
 
-                        if status == "success":
-                            method = result_dict["method"]
-                            stats["success_methods"][method] = stats["success_methods"].get(method, 0) + 1
-                        elif status == "skipped":
-                            reason = categorize_reason(result_dict.get("error", "Unknown"))
-                            stats["skipped_reasons"][reason] = stats["skipped_reasons"].get(reason, 0) + 1
-                        elif status == "failed":
-                            reason = categorize_reason(result_dict.get("error", "Unknown"))
-                            stats["failed_reasons"][reason] = stats["failed_reasons"].get(reason, 0) + 1
-                    
-                    if completed_results:
-                        live.update(render_display())
-                    else:
-                        time.sleep(0.1)
-                
-                # Force garbage collection
-                gc.collect()
+                        record_result(result)
+                        check_in_flight(time.monotonic())
+                        if not interactive and results_received % PLAIN_PROGRESS_INTERVAL == 0:
+                            console.print(render_stats_lines()[0])
+                finally:
+                    if profiler:
+                        profiler.disable()
+                    record_queue.put(None)
+                    status_queue.put(None)
+                    writer_thread.join()  # Wait for the last records to be written
+                    status_thread.join(timeout=5.0)
+                    gc.set_threshold(*gc_thresholds)
+                    gc.unfreeze()
+
+                live.refresh()  # Show the final counts
+
+        if profiler:
+            profiler.dump_stats(str(profile))
+            console.print(f"\n[cyan]Profile written to {profile}; top 20 by own time:[/]")
+            pstats.Stats(profiler, stream=sys.stdout).sort_stats("tottime").print_stats(20)
 
         # Display comprehensive statistics
         console.print(f"\n[bold green]✓ Extraction complete[/]\n")
@@ -827,17 +856,18 @@ def extract(
         summary_table.add_column("Category", style="cyan", width=20)
         summary_table.add_column("Count", justify="right", style="white", width=10)
         summary_table.add_column("Details", style="dim", width=65)
+        add_row = summary_table.add_row
 
         # Add overall stats
         total_processed = stats['success'] + stats['failed'] + stats['skipped']
-        summary_table.add_row(
+        add_row(
             "[bold]Total Processed[/]",
             f"[bold]{total_processed:,}[/]",
             ""
         )
 
         if previously_extracted > 0:
-            summary_table.add_row(
+            add_row(
                 "Previously Extracted",
                 f"{previously_extracted:,}",
                 "[dim]Files already successfully extracted in prior runs[/]"
@@ -845,48 +875,36 @@ def extract(
 
         # Success breakdown
         if stats['success'] > 0:
-            summary_table.add_row(
+            add_row(
                 "[green]Successful[/]",
                 f"[green]{stats['success']:,}[/]",
                 ""
             )
             # Show method breakdown
-            for method, count in sorted(stats['success_methods'].items(), key=lambda x: x[1], reverse=True):
-                summary_table.add_row(
-                    "",
-                    f"[dim]{count:,}[/]",
-                    f"[dim green]→ via {method}[/]"
-                )
+            for method, count in success_methods.most_common():
+                add_row("", f"[dim]{count:,}[/]", f"[dim green]→ via {method}[/]")
 
         # Skipped breakdown
         if stats['skipped'] > 0:
-            summary_table.add_row(
+            add_row(
                 "[yellow]Skipped[/]",
                 f"[yellow]{stats['skipped']:,}[/]",
                 ""
             )
             # Show skip reasons
-            for reason, count in sorted(stats['skipped_reasons'].items(), key=lambda x: x[1], reverse=True):
-                summary_table.add_row(
-                    "",
-                    f"[dim]{count:,}[/]",
-                    f"[dim yellow]→ {reason.replace('Skipped: ', '')}[/]"
-                )
+            for reason, count in skipped_reasons.most_common():
+                add_row("", f"[dim]{count:,}[/]", f"[dim yellow]→ {reason.replace('Skipped: ', '')}[/]")
 
         # Failed breakdown
         if stats['failed'] > 0:
-            summary_table.add_row(
+            add_row(
                 "[red]Failed[/]",
                 f"[red]{stats['failed']:,}[/]",
                 ""
             )
             # Show fail reasons
-            for reason, count in sorted(stats['failed_reasons'].items(), key=lambda x: x[1], reverse=True):
-                summary_table.add_row(
-                    "",
-                    f"[dim]{count:,}[/]",
-                    f"[dim red]→ {reason.replace('Failed: ', '')}[/]"
-                )
+            for reason, count in failed_reasons.most_common():
+                add_row("", f"[dim]{count:,}[/]", f"[dim red]→ {reason.replace('Failed: ', '')}[/]")
 
         console.print(summary_table)
         console.print()
@@ -994,6 +1012,8 @@ def label(
             console.print("[yellow]Escalation disabled[/]")
         if force:
             console.print("[yellow]Force mode: Re-labeling all files[/]")
+        if config.llm.concurrency > 1:
+            console.print(f"[bold cyan]Concurrent requests:[/] {config.llm.concurrency}")
 
         if total_files == 0:
             console.print("\n[green]✓ No files need labeling[/]")
@@ -1009,22 +1029,71 @@ def label(
         files = pipeline.get_files_for_labeling(force=force, limit=limit)
 
         # Track statistics
-        stats = {
-            "success": 0,
-            "failed": 0,
-            "escalated": 0,
-            "by_doc_type": {},
-            "errors": [],
+        stats = {"success": 0, "failed": 0, "escalated": 0}
+        by_doc_type: Counter[str] = Counter()  # doc_type -> count
+        errors: list[tuple[str, str]] = []  # (file name, error)
+
+        # Display rows for the current file and the last result are formatted once, when they
+        # change, rather than on every render
+        display_rows: dict[str, Any] = {
+            "processing": "[dim]waiting...[/]",
+            "last_result": [("", ""), ("[bold]Last Result:[/]", "[dim]--[/]")],
         }
 
-        # Track last result for display
-        last_result = {
-            "file": None,
-            "label": None,  # Full LabelOutput object
-            "escalated": False,
-            "error": None,
-        }
-        current_file = {"name": None}
+        def truncate(text: str, width: int = 85) -> str:
+            """Cut text to width characters, marking the cut with an ellipsis."""
+            return text[:width] + "..." if len(text) > width else text
+
+        def format_last_result(file_name: str, label, escalated: bool, error: Optional[str]) -> list[tuple[str, str]]:
+            """Build the (label, value) rows describing a finished file."""
+            display_name = truncate(file_name)
+            rows = [("", "")]  # Spacer
+
+            if error:
+                rows.append(("[bold]Last Result:[/]", f"[red]{display_name}[/]"))
+                rows.append(("Error:", f"[red]{error[:80]}[/]"))
+                return rows
+
+            # Confidence color
+            conf = label.confidence
+            if conf >= 0.85:
+                conf_style = "bold green"
+            elif conf >= 0.7:
+                conf_style = "green"
+            else:
+                conf_style = "yellow"
+
+            rows.append(("[bold]Last Result:[/]", f"[green]{display_name}[/]"))
+
+            # Type and confidence with escalation marker
+            escalate_marker = " [yellow](escalated)[/]" if escalated else ""
+            rows.append(("Type:", f"[bold]{label.doc_type}[/]{escalate_marker}"))
+            rows.append(("Confidence:", f"[{conf_style}]{conf:.0%}[/]"))
+
+            # Title, canonical filename and target path
+            rows.append(("Title:", truncate(label.title)))
+            rows.append(("Filename:", f"[dim]{truncate(label.canonical_filename)}[/]"))
+            rows.append(("Target:", f"[cyan]{label.target_group_path}[/]"))
+
+            # Date and issuer on same line if both present
+            meta_parts = []
+            if label.date:
+                meta_parts.append(f"[white]{label.date}[/]")
+            if label.issuer:
+                meta_parts.append(f"[white]{label.issuer}[/]")
+            if meta_parts:
+                rows.append(("Date/Issuer:", " | ".join(meta_parts)))
+
+            # Tags
+            if label.suggested_tags:
+                tags_str = ", ".join(label.suggested_tags[:6])
+                if len(label.suggested_tags) > 6:
+                    tags_str += f" (+{len(label.suggested_tags) - 6} more)"
+                rows.append(("Tags:", f"[magenta]{tags_str}[/]"))
+
+            # Why (reasoning) - truncated
+            rows.append(("Why:", f"[dim italic]{truncate(label.why, 100)}[/]"))
+            return rows
 
         def render_label_status() -> Panel:
             """Render current labeling status."""
@@ -1033,75 +1102,9 @@ def label(
             table.add_column("Label", style="cyan", width=18)
             table.add_column("Value", style="white", width=90)
 
-            # Current file being processed
-            if current_file["name"]:
-                display_name = current_file["name"][:85] + "..." if len(current_file["name"]) > 85 else current_file["name"]
-                table.add_row("Processing:", f"[yellow]{display_name}[/]")
-            else:
-                table.add_row("Processing:", "[dim]waiting...[/]")
-
-            # Last result - detailed view
-            if last_result["file"]:
-                display_name = last_result["file"][:85] + "..." if len(last_result["file"]) > 85 else last_result["file"]
-
-                if last_result["error"]:
-                    table.add_row("", "")  # Spacer
-                    table.add_row("[bold]Last Result:[/]", f"[red]{display_name}[/]")
-                    table.add_row("Error:", f"[red]{last_result['error'][:80]}[/]")
-                else:
-                    label = last_result["label"]
-                    escalated = last_result["escalated"]
-
-                    # Confidence color
-                    conf = label.confidence
-                    if conf >= 0.85:
-                        conf_style = "bold green"
-                    elif conf >= 0.7:
-                        conf_style = "green"
-                    else:
-                        conf_style = "yellow"
-
-                    table.add_row("", "")  # Spacer
-                    table.add_row("[bold]Last Result:[/]", f"[green]{display_name}[/]")
-
-                    # Type and confidence with escalation marker
-                    escalate_marker = " [yellow](escalated)[/]" if escalated else ""
-                    table.add_row("Type:", f"[bold]{label.doc_type}[/]{escalate_marker}")
-                    table.add_row("Confidence:", f"[{conf_style}]{conf:.0%}[/]")
-
-                    # Title
-                    title_display = label.title[:85] + "..." if len(label.title) > 85 else label.title
-                    table.add_row("Title:", title_display)
-
-                    # Canonical filename
-                    filename_display = label.canonical_filename[:85] + "..." if len(label.canonical_filename) > 85 else label.canonical_filename
-                    table.add_row("Filename:", f"[dim]{filename_display}[/]")
-
-                    # Target path
-                    table.add_row("Target:", f"[cyan]{label.target_group_path}[/]")
-
-                    # Date and issuer on same line if both present
-                    meta_parts = []
-                    if label.date:
-                        meta_parts.append(f"[white]{label.date}[/]")
-                    if label.issuer:
-                        meta_parts.append(f"[white]{label.issuer}[/]")
-                    if meta_parts:
-                        table.add_row("Date/Issuer:", " | ".join(meta_parts))
-
-                    # Tags
-                    if label.suggested_tags:
-                        tags_str = ", ".join(label.suggested_tags[:6])
-                        if len(label.suggested_tags) > 6:
-                            tags_str += f" (+{len(label.suggested_tags) - 6} more)"
-                        table.add_row("Tags:", f"[magenta]{tags_str}[/]")
-
-                    # Why (reasoning) - truncated
-                    why_display = label.why[:100] + "..." if len(label.why) > 100 else label.why
-                    table.add_row("Why:", f"[dim italic]{why_display}[/]")
-            else:
-                table.add_row("", "")
-                table.add_row("[bold]Last Result:[/]", "[dim]--[/]")
+            table.add_row("Processing:", display_rows["processing"])
+            for row in display_rows["last_result"]:
+                table.add_row(*row)
 
             # Overall stats
             total_completed = stats["success"] + stats["failed"]
@@ -1115,8 +1118,8 @@ def label(
             ]
 
             # Show top doc types if any
-            if stats["by_doc_type"]:
-                top_types = sorted(stats["by_doc_type"].items(), key=lambda x: x[1], reverse=True)[:5]
+            if by_doc_type:
+                top_types = by_doc_type.most_common(5)
                 types_str = ", ".join([f"{dtype}: {count}" for dtype, count in top_types])
                 status_lines.append(Text(f"  Types: {types_str}", style="dim green"))
 
@@ -1129,38 +1132,59 @@ def label(
                 border_style="cyan"
             )
 
-        with Live(render_label_status(), console=console, refresh_per_second=4, screen=False) as live:
-            for file_info in files:
-                file_path = Path(file_info["path"])
-                current_file["name"] = file_path.name
-                live.update(render_label_status())
+        # Files are labeled on a thread pool so LLM round-trips overlap when the server handles
+        # parallel requests; stats and the display are only touched here, on the main thread.
+        # At most `concurrency` files are submitted at a time so none wait in the executor's queue
+        # (their LLM timeout would be running) and "Processing" shows only files actually in flight
+        concurrency = config.llm.concurrency
+        file_iter = iter(files)
+        in_progress: dict[Future, str] = {}  # future -> file name
+
+        def submit_next() -> None:
+            """Start labeling the next file, if any are left."""
+            file_info = next(file_iter, None)
+            if file_info is not None:
+                future = executor.submit(pipeline.label_file, file_info, run_id, use_escalation=not no_escalate)
+                in_progress[future] = os.path.basename(file_info["path"])
+
+        def show_in_progress() -> None:
+            """Point the Processing row at the files currently being labeled."""
+            names = list(in_progress.values())
+            if not names:
+                display_rows["processing"] = "[dim]waiting...[/]"
+            elif len(names) == 1:
+                display_rows["processing"] = f"[yellow]{truncate(names[0])}[/]"
+            else:
+                display_rows["processing"] = f"[yellow]{truncate(names[0], 70)}[/] [dim](+{len(names) - 1} more)[/]"
+
+        with Live(render_label_status(), console=console, refresh_per_second=4, screen=False) as live, \
+                ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                submit_next()
+            show_in_progress()
+            live.update(render_label_status())
+
+            while in_progress:
+                done, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_name = in_progress.pop(future)
+                    label_result, escalated, error = future.result()
+
+                    if error:
+                        stats["failed"] += 1
+                        errors.append((file_name, error))
+                    else:
+                        stats["success"] += 1
+                        if escalated:
+                            stats["escalated"] += 1
+                        # Track doc types
+                        by_doc_type[label_result.doc_type] += 1
 
-                # Label the file
-                label_result, escalated, error = pipeline.label_file(
-                    file_info,
-                    run_id,
-                    use_escalation=not no_escalate,
-                )
-
-                # Update last result
-                last_result["file"] = file_path.name
-                last_result["error"] = error
-
-                if error:
-                    stats["failed"] += 1
-                    stats["errors"].append((file_path.name, error))
-                    last_result["label"] = None
-                    last_result["escalated"] = False
-                else:
-                    stats["success"] += 1
-                    if escalated:
-                        stats["escalated"] += 1
-                    # Track doc types
-                    doc_type = label_result.doc_type
-                    stats["by_doc_type"][doc_type] = stats["by_doc_type"].get(doc_type, 0) + 1
-                    last_result["label"] = label_result
-                    last_result["escalated"] = escalated
+                    # Update last result
+                    display_rows["last_result"] = format_last_result(file_name, label_result, escalated, error)
+                    submit_next()
 
+                show_in_progress()
                 live.update(render_label_status())
 
         # Complete run
@@ -1182,21 +1206,20 @@ def label(
         console.print(summary_table)
 
         # Doc type breakdown
-        if stats["by_doc_type"]:
+        if by_doc_type:
             console.print("\n[bold cyan]Document Types:[/]")
-            sorted_types = sorted(stats["by_doc_type"].items(), key=lambda x: x[1], reverse=True)
-            for doc_type, count in sorted_types[:10]:  # Top 10
+            for doc_type, count in by_doc_type.most_common(10):  # Top 10
                 console.print(f"  {doc_type}: {count}")
-            if len(sorted_types) > 10:
-                console.print(f"  ... and {len(sorted_types) - 10} more types")
+            if len(by_doc_type) > 10:
+                console.print(f"  ... and {len(by_doc_type) - 10} more types")
 
         # Show errors if any
-        if stats["errors"]:
-            console.print(f"\n[bold red]Errors ({len(stats['errors'])}):[/]")
-            for filename, error in stats["errors"][:5]:
+        if errors:
+            console.print(f"\n[bold red]Errors ({len(errors)}):[/]")
+            for filename, error in errors[:5]:
                 console.print(f"  {filename}: {error[:60]}")
-            if len(stats["errors"]) > 5:
-                console.print(f"  ... and {len(stats['errors']) - 5} more errors")
+            if len(errors) > 5:
+                console.print(f"  ... and {len(errors) - 5} more errors")
 
         # Show sample results
         console.print("\n[bold cyan]Sample Results:[/]")
@@ -1206,7 +1229,6 @@ def label(
 
     except Exception as e:
         console.print(f"[bold red]Error:[/] {e}")
-        import traceback
         traceback.print_exc()
         if 'database' in locals() and 'run_id' in locals():
             database.complete_run(run_id, error=str(e))
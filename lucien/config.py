@@ -9,15 +9,27 @@ Loads configuration from (in order of precedence, highest to lowest):
 5. Built-in defaults
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import List, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# libyaml's C loader parses several times faster than the pure-Python one (every CLI
+# command parses the config at startup); fall back if PyYAML was built without it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_yaml(yaml_path: Path) -> dict:
+    """Parse a YAML config file (an empty file gives an empty dict)."""
+    with open(yaml_path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 class LLMSettings(BaseModel):
     """LLM configuration for LM Studio."""
 
@@ -31,6 +43,11 @@ class LLMSettings(BaseModel):
     )
     max_retries: int = Field(default=2, description="Maximum retry attempts for LLM calls")
     timeout: int = Field(default=30, description="Timeout in seconds for LLM calls")
+    concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Files labeled at once (raise only if the server handles parallel requests)"
+    )
 
 
 class ExtractionSettings(BaseModel):
@@ -49,6 +66,12 @@ class ExtractionSettings(BaseModel):
         default=True,
         description="Use Docling for extraction (high quality but memory intensive ~10GB per worker)"
     )
+    max_tasks_per_worker: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Files each extraction worker processes before it is restarted "
+                    "(default: 20 with Docling, 200 without)"
+    )
 
 
 class TaxonomySettings(BaseModel):
@@ -196,6 +219,15 @@ class LucienSettings(BaseSettings):
         description="Log file path"
     )
 
+    @field_validator("log_level")
+    @classmethod
+    def _check_log_level(cls, value: str) -> str:
+        """Normalize the level name to upper case and reject names logging doesn't know."""
+        level = value.upper()
+        if level not in logging.getLevelNamesMapping():
+            raise ValueError(f"Unknown log level {value!r} (use DEBUG, INFO, WARNING, ERROR or CRITICAL)")
+        return level
+
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
         self.index_db.parent.mkdir(parents=True, exist_ok=True)
@@ -212,10 +244,7 @@ class LucienSettings(BaseSettings):
         if not yaml_path.exists():
             raise FileNotFoundError(f"Config file not found: {yaml_path}")
 
-        with open(yaml_path) as f:
-            config_dict = yaml.safe_load(f)
-
-        return cls(**config_dict)
+        return cls(**_read_yaml(yaml_path))
 
     @classmethod
     def load(cls) -> "LucienSettings":
@@ -238,18 +267,14 @@ class LucienSettings(BaseSettings):
         # Try new user config location (overrides XDG)
         user_config = Path.home() / ".lucien/config.yaml"
         if user_config.exists():
-            user_dict = {}
-            with open(user_config) as f:
-                user_dict = yaml.safe_load(f)
+            user_dict = _read_yaml(user_config)
             # Merge with existing config
             config = cls(**{**config.model_dump(), **user_dict})
 
         # Override with project-local config (highest priority)
         local_config = Path.cwd() / "lucien.yaml"
         if local_config.exists():
-            local_dict = {}
-            with open(local_config) as f:
-                local_dict = yaml.safe_load(f)
+            local_dict = _read_yaml(local_config)
             # Merge with existing config (env vars already applied)
             config = cls(**{**config.model_dump(), **local_dict})
 
@@ -6,6 +6,7 @@ Handles schema creation, migrations, and core database operations.
 
 import json
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -195,24 +196,45 @@ class Database:
         """Initialize database connection."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection per thread, opened on first use and kept for the life of this object
+        # (the extract writer thread and the main thread each get their own)
+        self._local = threading.local()
         self._ensure_schema()
 
-    @contextmanager
-    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connections."""
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection and apply the per-connection pragmas once."""
         conn = sqlite3.connect(str(self.db_path), timeout=30.0)
         conn.row_factory = sqlite3.Row
         # Enable WAL mode for better concurrent access
         conn.execute("PRAGMA journal_mode=WAL")
         # Set busy timeout to handle concurrent writes
         conn.execute("PRAGMA busy_timeout=30000")
+        # In WAL mode NORMAL only syncs at checkpoints; commits stay durable across app crashes
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # 64 MB page cache and 256 MB memory map; both only pay off on a long-lived connection
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @contextmanager
+    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for this thread's connection; commits on success, rolls back on error."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
+
+    def close(self) -> None:
+        """Close the calling thread's connection, if it has one open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
             conn.close()
 
     def _ensure_schema(self) -> None:
@@ -512,9 +534,46 @@ class Database:
             cursor = conn.execute(query)
             return cursor.fetchone()[0]
 
+    def count_extraction_candidates(self, force: bool = False,
+                                    skip_extensions: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Count files for the extraction summary in a single pass over the files table.
+
+        Args:
+            force: If True, count already extracted files as needing extraction
+            skip_extensions: List of file extensions to skip (e.g., ['.jpg', '.png'])
+
+        Returns:
+            Dictionary with total_files, previously_extracted, skipped_by_extension
+            and to_extract counts
+        """
+        # Simple LIKE pattern - no special characters to escape in extensions
+        extension_conditions = [f"LOWER(f.path) LIKE '%{ext.lower()}'" for ext in skip_extensions or []]
+        skipped_expr = f"({' OR '.join(extension_conditions)})" if extension_conditions else "0"
+
+        with self._get_connection() as conn:
+            query = f"""
+                SELECT
+                    COUNT(*) AS total_files,
+                    COALESCE(SUM(extracted), 0) AS previously_extracted,
+                    COALESCE(SUM(skipped), 0) AS skipped_by_extension,
+                    COALESCE(SUM(NOT skipped AND (? OR NOT extracted)), 0) AS to_extract
+                FROM (
+                    SELECT
+                        EXISTS(
+                            SELECT 1 FROM extractions e WHERE e.file_id = f.id AND e.status = 'success'
+                        ) AS extracted,
+                        {skipped_expr} AS skipped
+                    FROM files f
+                )
+            """
+            cursor = conn.execute(query, (1 if force else 0,))
+            return dict(cursor.fetchone())
+
     def get_files_for_extraction(self, force: bool = False, limit: Optional[int] = None,
                                  offset: Optional[int] = None, batch_size: Optional[int] = None,
-                                 skip_extensions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+                                 skip_extensions: Optional[List[str]] = None,
+                                 after_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get files that need extraction.
 
@@ -524,6 +583,7 @@ class Database:
             offset: Offset for pagination
             batch_size: Number of files to return in this batch (for memory efficiency)
             skip_extensions: List of file extensions to skip (e.g., ['.jpg', '.png'])
+            after_path: Only return files whose path sorts after this one (keyset pagination)
 
         Returns:
             List of file records as dictionaries
@@ -532,7 +592,7 @@ class Database:
             if force:
                 # Get all files
                 query = "SELECT f.id, f.path, f.sha256 FROM files f"
-                params = []
+                params: List[Any] = []
             else:
                 # Get files without successful extraction
                 query = """
@@ -560,6 +620,11 @@ class Database:
                     else:
                         query += " WHERE (" + " AND ".join(extension_conditions) + ")"
 
+            # Resume after the last path of the previous batch (uses the UNIQUE index on path)
+            if after_path is not None:
+                query += " AND f.path > ?" if "WHERE" in query else " WHERE f.path > ?"
+                params.append(after_path)
+
             # Add ORDER BY before LIMIT/OFFSET
             query += " ORDER BY f.path" if "ORDER BY" not in query else ""
 
@@ -603,6 +668,52 @@ class Database:
         )
         return self.insert_extraction(extraction)
 
+    def record_extractions_bulk(
+        self,
+        records: List[Tuple[int, int, str, str, Optional[str], Optional[str]]],
+    ) -> int:
+        """
+        Record many extraction results in a single transaction.
+
+        If a record violates a constraint, the batch is retried row by row
+        and only the offending records are dropped.
+
+        Args:
+            records: Tuples of (file_id, run_id, method, status, output_path, error)
+
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+
+        query = """
+            INSERT INTO extractions (file_id, extraction_run_id, method, status, output_path, error)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(file_id, extraction_run_id) DO UPDATE SET
+                method = excluded.method,
+                status = excluded.status,
+                output_path = excluded.output_path,
+                error = excluded.error
+        """
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(query, records)
+            return len(records)
+        except sqlite3.IntegrityError:
+            pass
+
+        # A failed statement only rolls back itself, so the good rows still commit together
+        written = 0
+        with self._get_connection() as conn:
+            for record in records:
+                try:
+                    conn.execute(query, record)
+                    written += 1
+                except sqlite3.IntegrityError:
+                    continue
+        return written
+
     def get_extraction_stats(self, run_id: Optional[int] = None) -> Dict[str, int]:
         """
         Get extraction statistics.
@@ -10,20 +10,94 @@ import gc
 import io
 import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, Optional
 from multiprocessing import Queue
 
 from .config import LucienSettings
+from .db import Database
 from .extractors import ExtractionResult
 from .pipeline import ExtractionPipeline
 
 
+@dataclass(slots=True)
+class PoolResult:
+    """Result of one extract_file_for_pool task, as sent back to the parent process."""
+    file_id: int
+    status: str  # 'success', 'failed', 'skipped'
+    method: str
+    output_path: Optional[str]
+    error: Optional[str]
+
+
+# Queue for reporting task start/finish to the parent process (set by init_pool_worker)
+_status_queue: Optional[Queue] = None
+
+# Per-process pool state: the config passed to init_pool_worker and the pipeline built
+# from it on the first task, reused for every later task this process runs
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def init_pool_worker(
+    status_queue: Optional[Queue] = None,
+    config: Optional[LucienSettings] = None,
+) -> None:
+    """
+    Initializer for multiprocessing.Pool worker processes.
+
+    Args:
+        status_queue: Queue on which extract_file_for_pool reports
+            ("start"/"done", pid, file_id, file_name) events
+        config: The parent's fully resolved config (including command-line overrides),
+            so workers don't re-read and re-parse the YAML files
+    """
+    global _status_queue
+    _status_queue = status_queue
+    _WORKER_STATE.clear()
+    _WORKER_STATE["config"] = config
+
+
+def _load_pipeline(
+    config_path: Optional[Path] = None,
+    db_path: Optional[Path] = None,
+    extracted_text_dir: Optional[Path] = None,
+) -> ExtractionPipeline:
+    """Load config and create an extraction pipeline (this creates new extractors in this process)."""
+    if config_path:
+        config = LucienSettings.load_from_yaml(config_path)
+    else:
+        config = LucienSettings.load()
+
+    # Override paths if provided
+    if db_path:
+        config.index_db = db_path
+    if extracted_text_dir:
+        config.extracted_text_dir = extracted_text_dir
+
+    database = Database(config.index_db)
+    return ExtractionPipeline(config, database)
+
+
+def _get_worker_pipeline() -> ExtractionPipeline:
+    """Return this pool process's pipeline, creating it on first use."""
+    pipeline = _WORKER_STATE.get("pipeline")
+    if pipeline is None:
+        config = _WORKER_STATE.get("config")
+        if config is None:
+            pipeline = _load_pipeline()
+        else:
+            pipeline = ExtractionPipeline(config, Database(config.index_db))
+        _WORKER_STATE["pipeline"] = pipeline
+    return pipeline
+
+
 def extract_file_worker(
     file_info: Dict[str, Any],
     config_path: Optional[Path] = None,
     db_path: Optional[Path] = None,
     extracted_text_dir: Optional[Path] = None,
+    pipeline: Optional[ExtractionPipeline] = None,
 ) -> Dict[str, Any]:
     """
     Extract a single file in a subprocess.
@@ -33,27 +107,14 @@ def extract_file_worker(
         config_path: Path to config file (optional)
         db_path: Path to database (optional, overrides config)
         extracted_text_dir: Path to extracted text directory (optional, overrides config)
+        pipeline: Existing pipeline to reuse (optional; the paths above are ignored if given)
     
     Returns:
         Dictionary with extraction result: status, method, output_path, error
     """
     try:
-        # Load config
-        if config_path:
-            config = LucienSettings.load_from_yaml(config_path)
-        else:
-            config = LucienSettings.load()
-        
-        # Override paths if provided
-        if db_path:
-            config.index_db = db_path
-        if extracted_text_dir:
-            config.extracted_text_dir = extracted_text_dir
-        
-        # Create pipeline (this will create new extractors in this process)
-        from .db import Database
-        database = Database(config.index_db)
-        pipeline = ExtractionPipeline(config, database)
+        if pipeline is None:
+            pipeline = _load_pipeline(config_path, db_path, extracted_text_dir)
         
         # Extract file
         file_path = Path(file_info["path"])
@@ -129,18 +190,23 @@ def extract_file_worker_subprocess(
         }))
 
 
-def extract_file_for_pool(args_tuple: tuple) -> tuple:
+def extract_file_for_pool(file_info_dict: Dict[str, Any]) -> PoolResult:
     """
     Worker function for multiprocessing.Pool.
     
     This is a module-level function that can be pickled.
-    Accepts a tuple of (file_info_dict, config_path, db_path, extracted_text_dir).
-    Returns (file_info, result_dict) tuple.
+    Accepts the file_info dict; the config comes from init_pool_worker and the
+    pipeline is built once per worker process, not per file.
+    Returns a PoolResult (smaller to pickle than echoing file_info and a result dict).
     
     Suppresses stderr to prevent duplicate error messages from parallel workers.
+    If the pool was set up with init_pool_worker, start and finish of each file
+    are reported on the status queue so the parent can show per-worker progress.
     """
-    file_info_dict, config_path, db_path, extracted_text_dir = args_tuple
-    
+    file_name = os.path.basename(file_info_dict["path"])
+    if _status_queue is not None:
+        _status_queue.put(("start", os.getpid(), file_info_dict["id"], file_name))
+
     # Suppress stderr to prevent duplicate error messages from parallel workers
     # PyPDF and other libraries print warnings/errors to stderr (e.g., "Ignoring wrong pointing object")
     # With multiple workers, we'd see the same error multiple times and it causes screen tear with Rich
@@ -148,21 +214,26 @@ def extract_file_for_pool(args_tuple: tuple) -> tuple:
     with open(os.devnull, 'w') as devnull:
         with contextlib.redirect_stderr(devnull):
             try:
-                result_dict = extract_file_worker(
-                    file_info_dict,
-                    config_path=config_path,
-                    db_path=db_path,
-                    extracted_text_dir=extracted_text_dir,
-                )
-                return (file_info_dict, result_dict)
+                result_dict = extract_file_worker(file_info_dict, pipeline=_get_worker_pipeline())
             except Exception as e:
                 # Errors are handled by returning failed status, no need to log here
-                return (file_info_dict, {
+                result_dict = {
                     "status": "failed",
                     "method": "unknown",
                     "output_path": None,
                     "error": f"Worker exception: {type(e).__name__}: {e}",
-                })
+                }
+
+    if _status_queue is not None:
+        _status_queue.put(("done", os.getpid(), file_info_dict["id"], file_name))
+
+    return PoolResult(
+        file_info_dict["id"],
+        result_dict["status"],
+        result_dict["method"],
+        result_dict["output_path"],
+        result_dict["error"],
+    )
 
 
 if __name__ == "__main__":
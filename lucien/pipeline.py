@@ -145,6 +145,13 @@ class ExtractionPipeline:
             skip_extensions=self.config.extraction.skip_extensions
         )
 
+    def count_extraction_candidates(self, force: bool = False) -> dict:
+        """Count total, previously extracted, skipped-by-extension and to-extract files in one query."""
+        return self.database.count_extraction_candidates(
+            force=force,
+            skip_extensions=self.config.extraction.skip_extensions
+        )
+
     def iter_files_for_extraction(self, force: bool = False, limit: Optional[int] = None,
                                    batch_size: int = 100) -> Generator[List[dict], None, None]:
         """
@@ -158,7 +165,9 @@ class ExtractionPipeline:
         Yields:
             Batches of file records as dictionaries
         """
-        offset = 0
+        # Page by the last path seen rather than OFFSET: files extracted while we iterate
+        # drop out of the result set, which would shift offsets and skip unprocessed files
+        last_path = None
         processed = 0
 
         while True:
@@ -173,9 +182,9 @@ class ExtractionPipeline:
 
             batch = self.database.get_files_for_extraction(
                 force=force,
-                offset=offset,
                 batch_size=current_batch_size,
-                skip_extensions=self.config.extraction.skip_extensions
+                skip_extensions=self.config.extraction.skip_extensions,
+                after_path=last_path,
             )
 
             if not batch:
@@ -184,7 +193,7 @@ class ExtractionPipeline:
             yield batch
 
             processed += len(batch)
-            offset += len(batch)
+            last_path = batch[-1]["path"]
 
             if limit and processed >= limit:
                 break
\ No newline at end of file
@@ -7,8 +7,11 @@ and stores file metadata in the database.
 
 import hashlib
 import mimetypes
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Deque, Generator, Optional, Tuple
 
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
@@ -19,6 +22,10 @@ from .db import Database, FileRecord
 class FileScanner:
     """Scans filesystem and indexes files."""
 
+    # Files stat'ed and hashed concurrently; file reads and hashlib release the GIL,
+    # so threads keep the disk busy while the main thread writes to the database
+    HASH_WORKERS = 8
+
     def __init__(self, config: LucienSettings, db: Database):
         """Initialize scanner with config and database."""
         self.config = config
@@ -33,8 +40,8 @@ class FileScanner:
         """Compute file hash using specified algorithm."""
         hash_func = hashlib.new(algorithm)
         with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(8192), b""):
+            # Read in chunks to handle large files (large enough that hashing runs mostly without the GIL)
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
                 hash_func.update(chunk)
         return hash_func.hexdigest()
 
@@ -43,14 +50,21 @@ class FileScanner:
         mime_type, _ = mimetypes.guess_type(str(file_path))
         return mime_type
 
-    def scan_file(self, file_path: Path, run_id: int) -> Optional[FileRecord]:
+    def scan_file(
+        self,
+        file_path: Path,
+        run_id: int,
+        stat: Optional[os.stat_result] = None,
+    ) -> Optional[FileRecord]:
         """
         Scan a single file and return a FileRecord.
 
+        Uses stat if given (e.g. from a DirEntry), otherwise stats the path.
         Returns None if file cannot be accessed.
         """
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = file_path.stat()
 
             # Compute hash (expensive operation)
             sha256 = self.compute_hash(file_path, self.config.scan.hash_algorithm)
@@ -71,35 +85,51 @@ class FileScanner:
             # Log error and skip file
             return None
 
+    def _scan_entry(self, entry: os.DirEntry, run_id: int) -> Optional[FileRecord]:
+        """Scan a file found by the walker, reusing the DirEntry's (cached) stat."""
+        try:
+            stat = entry.stat()
+        except OSError:
+            return None
+        return self.scan_file(Path(entry.path), run_id, stat)
+
     def iter_files(self, root_path: Path) -> Generator[Path, None, None]:
         """
         Recursively iterate over files in directory tree.
 
         Skips directories based on config.
         """
+        for entry in self._iter_entries(root_path):
+            yield Path(entry.path)
+
+    def _iter_entries(self, root_path: Path) -> Generator[os.DirEntry, None, None]:
+        """Walk the tree like iter_files, yielding the os.DirEntry of each file."""
         if not root_path.exists():
             raise FileNotFoundError(f"Source root does not exist: {root_path}")
 
         if not root_path.is_dir():
             raise NotADirectoryError(f"Source root is not a directory: {root_path}")
 
-        def _walk(path: Path) -> Generator[Path, None, None]:
-            """Recursive walker with skip logic."""
+        follow_symlinks = self.config.scan.follow_symlinks
+
+        def _walk(path: str) -> Generator[os.DirEntry, None, None]:
+            """Recursive walker with skip logic (scandir entries answer type checks without extra stat calls)."""
             try:
-                for item in path.iterdir():
-                    if item.is_dir():
-                        if self.should_skip_directory(item):
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if not follow_symlinks and entry.is_symlink():
                             continue
-                        if self.config.scan.follow_symlinks or not item.is_symlink():
-                            yield from _walk(item)
-                    elif item.is_file():
-                        if self.config.scan.follow_symlinks or not item.is_symlink():
-                            yield item
+                        if entry.is_dir():
+                            if self.should_skip_directory(Path(entry.path)):
+                                continue
+                            yield from _walk(entry.path)
+                        elif entry.is_file():
+                            yield entry
             except PermissionError:
                 # Skip directories we can't access
                 pass
 
-        yield from _walk(root_path)
+        yield from _walk(str(root_path))
 
     def scan(
         self,
@@ -150,19 +180,34 @@ class FileScanner:
                 progress.update(task, description=f"[cyan]Scanning {total} files...", total=total)
 
                 # Second pass: scan and index (process incrementally)
-                for file_path in self.iter_files(root_path):
-                    progress.update(task, current_file=str(file_path.name))
-
-                    file_record = self.scan_file(file_path, run_id)
-
-                    if file_record:
-                        if not dry_run:
-                            self.db.insert_file(file_record)
-                        indexed_count += 1
-                    else:
-                        error_count += 1
-
-                    progress.advance(task)
+                # Files are hashed on a thread pool with a bounded window of pending files;
+                # results are indexed in walk order on this thread
+                with ThreadPoolExecutor(max_workers=self.HASH_WORKERS) as executor:
+                    pending: Deque[Tuple[Path, Future]] = deque()
+
+                    def index_next() -> None:
+                        nonlocal indexed_count, error_count
+                        file_path, future = pending.popleft()
+                        progress.update(task, current_file=str(file_path.name))
+
+                        file_record = future.result()
+
+                        if file_record:
+                            if not dry_run:
+                                self.db.insert_file(file_record)
+                            indexed_count += 1
+                        else:
+                            error_count += 1
+
+                        progress.advance(task)
+
+                    for entry in self._iter_entries(root_path):
+                        pending.append((Path(entry.path), executor.submit(self._scan_entry, entry, run_id)))
+                        if len(pending) >= self.HASH_WORKERS * 4:
+                            index_next()
+
+                    while pending:
+                        index_next()
 
             # Complete run
             if not dry_run:
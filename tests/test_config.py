@@ -16,6 +16,8 @@ def test_config_defaults():
     assert config.llm.default_model == "qwen2.5-7b-instruct"
     assert config.llm.escalation_threshold == 0.7
     assert config.scan.hash_algorithm == "sha256"
+    assert config.extraction.max_tasks_per_worker is None
+    assert config.llm.concurrency == 1
 
 
 def test_config_llm_settings():
@@ -68,3 +70,85 @@ def test_scanner_skip_dirs():
     assert scanner.should_skip_directory(Path(".git"))
     assert scanner.should_skip_directory(Path("__pycache__"))
     assert not scanner.should_skip_directory(Path("Documents"))
+
+
+def test_record_extractions_bulk(tmp_path):
+    """Test bulk extraction recording upserts rows in one call."""
+    from lucien.db import Database, FileRecord
+
+    db = Database(tmp_path / "test.db")
+    run_id = db.create_run("extract")
+    file_ids = [
+        db.insert_file(FileRecord(path=f"/docs/{i}.txt", sha256=f"{i}", size=1, mtime=0, ctime=0, scan_run_id=run_id))
+        for i in range(3)
+    ]
+
+    written = db.record_extractions_bulk([
+        (file_ids[0], run_id, "text", "success", "/out/0.txt.gz", None),
+        (file_ids[1], run_id, "none", "skipped", None, "Extension .jpg in skip list"),
+        (file_ids[2], run_id, "all", "failed", None, "All extractors failed"),
+    ])
+    assert written == 3
+    assert db.get_extraction_stats(run_id) == {"success": 1, "skipped": 1, "failed": 1}
+
+    # Re-recording the same file in the same run updates the existing row
+    db.record_extractions_bulk([(file_ids[2], run_id, "text", "success", "/out/2.txt.gz", None)])
+    assert db.get_extraction(file_ids[2], run_id).status == "success"
+    assert db.record_extractions_bulk([]) == 0
+
+    # A record violating a constraint (NULL method) doesn't take the rest of the batch with it
+    written = db.record_extractions_bulk([
+        (file_ids[0], run_id, None, "failed", None, "bad"),
+        (file_ids[1], run_id, "text", "success", "/out/1.txt.gz", None),
+    ])
+    assert written == 1
+    assert db.get_extraction(file_ids[1], run_id).status == "success"
+    assert db.get_extraction(file_ids[0], run_id).status == "success"
+
+
+def test_extraction_candidates_and_keyset_paging(tmp_path):
+    """Test the single-query extraction counts and paging by last path."""
+    from lucien.db import Database, FileRecord
+
+    db = Database(tmp_path / "test.db")
+    run_id = db.create_run("extract")
+    paths = ["/docs/a.txt", "/docs/b.JPG", "/docs/c.pdf", "/docs/d.txt"]
+    file_ids = [
+        db.insert_file(FileRecord(path=path, sha256=path, size=1, mtime=0, ctime=0, scan_run_id=run_id))
+        for path in paths
+    ]
+    db.record_extractions_bulk([(file_ids[0], run_id, "text", "success", "/out/a.txt.gz", None)])
+
+    counts = db.count_extraction_candidates(skip_extensions=[".jpg"])
+    assert counts == {"total_files": 4, "previously_extracted": 1, "skipped_by_extension": 1, "to_extract": 2}
+    assert counts["to_extract"] == db.count_files_for_extraction(skip_extensions=[".jpg"])
+    assert db.count_extraction_candidates(force=True, skip_extensions=[".jpg"])["to_extract"] == 3
+
+    # Files extracted between batches don't shift the next page
+    first = db.get_files_for_extraction(batch_size=1, skip_extensions=[".jpg"])
+    assert [f["path"] for f in first] == ["/docs/c.pdf"]
+    db.record_extractions_bulk([(file_ids[2], run_id, "pypdf", "success", "/out/c.txt.gz", None)])
+    rest = db.get_files_for_extraction(batch_size=10, skip_extensions=[".jpg"], after_path=first[-1]["path"])
+    assert [f["path"] for f in rest] == ["/docs/d.txt"]
+
+
+def test_load_from_yaml(tmp_path):
+    """Test loading overrides from a YAML file, including an empty one."""
+    config_path = tmp_path / "lucien.yaml"
+    config_path.write_text("llm:\n  default_model: test-model\n  concurrency: 3\n")
+    config = LucienSettings.load_from_yaml(config_path)
+    assert config.llm.default_model == "test-model"
+    assert config.llm.concurrency == 3
+    assert config.scan.hash_algorithm == "sha256"
+
+    config_path.write_text("")
+    assert LucienSettings.load_from_yaml(config_path).llm.default_model == "qwen2.5-7b-instruct"
+
+
+def test_log_level_validation():
+    """Test that log levels are normalized and unknown names are rejected."""
+    from pydantic import ValidationError
+
+    assert LucienSettings(log_level="debug").log_level == "DEBUG"
+    with pytest.raises(ValidationError):
+        LucienSettings(log_level="verbose")
@@ -578,3 +578,98 @@ class TestEndToEndPipeline:
         # All files should be labeled
         remaining = pipeline.get_files_for_labeling()
         assert len(remaining) == 0
+
+
+# =============================================================================
+# Concurrent Label Command Tests
+# =============================================================================
+
+class TestConcurrentLabelCommand:
+    """Tests for the label command's thread-pool loop (llm.concurrency > 1)."""
+
+    def test_concurrent_labels_and_isolated_errors(self, mock_llm_client, tmp_path):
+        """Files are labeled in parallel, each result lands on its own file, and one LLM error doesn't stop the rest."""
+        import threading
+        import yaml
+        from typer.testing import CliRunner
+        from lucien.cli import app
+
+        concurrency = 3
+        config_path = tmp_path / "lucien.yaml"
+        config_path.write_text(yaml.safe_dump({
+            "index_db": str(tmp_path / "index.db"),
+            "extracted_text_dir": str(tmp_path / "extracted"),
+            "staging_root": str(tmp_path / "staging"),
+            "plans_dir": str(tmp_path / "plans"),
+            "cache_dir": str(tmp_path / "cache"),
+            "log_file": str(tmp_path / "logs" / "lucien.log"),
+            "llm": {"concurrency": concurrency},
+        }))
+        config = LucienSettings.load_from_yaml(config_path)
+
+        # Six extracted files to label
+        database = Database(config.index_db)
+        scan_run_id = database.create_run("scan", {})
+        file_ids = {}
+        for i in range(6):
+            name = f"doc{i}.pdf"
+            file_ids[name] = database.insert_file(FileRecord(
+                path=f"/test/{name}",
+                sha256=f"hash{i}",
+                size=10000,
+                mtime=1700000000,
+                ctime=1700000000,
+                scan_run_id=scan_run_id,
+            ))
+            extraction_file = tmp_path / f"extracted{i}.txt"
+            extraction_file.write_text(f"Document {i} content")
+            database.record_extraction(
+                file_id=file_ids[name],
+                run_id=scan_run_id,
+                method="docling",
+                status="success",
+                output_path=str(extraction_file),
+            )
+
+        # The first `concurrency` calls meet at a barrier, which only releases if they run at once
+        first_batch = threading.Barrier(concurrency, timeout=10)
+        calls = []
+        calls_lock = threading.Lock()
+
+        def fake_label(context):
+            with calls_lock:
+                calls.append(context.filename)
+                call_number = len(calls)
+            if call_number <= concurrency:
+                first_batch.wait()
+            if context.filename == "doc3.pdf":
+                raise RuntimeError("LLM request failed")
+            return LabelOutput(
+                doc_type="financial",
+                title=f"Title for {context.filename}",
+                canonical_filename="2024-01-01-Financial-Bank-Statement",
+                suggested_tags=["finances"],
+                target_group_path="03 Financial",
+                confidence=0.9,
+                why="Bank statement",
+            ), False
+
+        mock_instance = mock_llm_client.return_value
+        mock_instance.label_with_escalation.side_effect = fake_label
+        models = Mock()
+        models.data = [Mock(id=config.llm.default_model), Mock(id=config.llm.escalation_model)]
+        mock_instance.client.models.list.return_value = models
+
+        result = CliRunner().invoke(app, ["label", "--config", str(config_path)])
+
+        assert result.exit_code == 0, result.output
+        assert sorted(calls) == sorted(file_ids)
+        assert "LLM request failed" in result.output
+
+        # Every file but the failed one has its own label recorded
+        for name, file_id in file_ids.items():
+            label = database.get_latest_label(file_id)
+            if name == "doc3.pdf":
+                assert label is None
+            else:
+                assert label.title == f"Title for {name}"
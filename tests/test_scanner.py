@@ -0,0 +1,117 @@
+"""
+Tests for the filesystem scanner.
+"""
+
+import hashlib
+import os
+
+import pytest
+from pathlib import Path
+
+from lucien.config import LucienSettings
+from lucien.db import Database
+from lucien.scanner import FileScanner
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """Create a small source tree with a skipped directory and a symlink."""
+    root = tmp_path / "source"
+    (root / "Documents" / "Taxes").mkdir(parents=True)
+    (root / ".git").mkdir()
+
+    (root / "readme.txt").write_text("top level")
+    (root / "Documents" / "letter.txt").write_text("dear sir")
+    (root / "Documents" / "Taxes" / "2023.txt").write_text("tax return")
+    (root / ".git" / "HEAD").write_text("ref: refs/heads/main")
+    os.symlink(root / "readme.txt", root / "Documents" / "readme-link.txt")
+
+    return root
+
+
+@pytest.fixture
+def scanner(tmp_path):
+    """Scanner backed by a file database."""
+    config = LucienSettings()
+    db = Database(tmp_path / "test.db")
+    return FileScanner(config, db)
+
+
+def _relative(paths, root):
+    return sorted(str(Path(p).relative_to(root)) for p in paths)
+
+
+class TestIterFiles:
+    """Tests for walking the source tree."""
+
+    def test_skips_configured_dirs_and_symlinks(self, scanner, source_tree):
+        """Files under skip_dirs and symlinks are not yielded by default."""
+        files = _relative(scanner.iter_files(source_tree), source_tree)
+        assert files == ["Documents/Taxes/2023.txt", "Documents/letter.txt", "readme.txt"]
+
+    def test_follows_symlinks_when_enabled(self, scanner, source_tree):
+        """With follow_symlinks, symlinked files are yielded like regular files."""
+        scanner.config.scan.follow_symlinks = True
+        files = _relative(scanner.iter_files(source_tree), source_tree)
+        assert "Documents/readme-link.txt" in files
+        assert ".git/HEAD" not in files
+
+    def test_missing_root_raises(self, scanner, tmp_path):
+        """A missing source root is reported when iteration starts."""
+        with pytest.raises(FileNotFoundError):
+            list(scanner.iter_files(tmp_path / "missing"))
+
+    def test_file_root_raises(self, scanner, source_tree):
+        """A source root that is a file is rejected."""
+        with pytest.raises(NotADirectoryError):
+            list(scanner.iter_files(source_tree / "readme.txt"))
+
+
+class TestScan:
+    """Tests for indexing files into the database."""
+
+    def test_indexes_every_walked_file(self, scanner, source_tree):
+        """scan indexes each walked file with its hash, size and mtime."""
+        assert scanner.scan(source_tree) == 3
+
+        records = scanner.db.get_all_files()
+        assert _relative([r.path for r in records], source_tree) == [
+            "Documents/Taxes/2023.txt", "Documents/letter.txt", "readme.txt"
+        ]
+        letter = scanner.db.get_file_by_path(str(source_tree / "Documents" / "letter.txt"))
+        assert letter.sha256 == hashlib.sha256(b"dear sir").hexdigest()
+        assert letter.size == len("dear sir")
+        assert letter.mtime == int((source_tree / "Documents" / "letter.txt").stat().st_mtime)
+
+    def test_indexes_in_walk_order(self, scanner, tmp_path):
+        """Files are inserted in walk order even though hashing runs on a thread pool."""
+        root = tmp_path / "many"
+        root.mkdir()
+        # More files than the pending window, so indexing overlaps with the walk
+        for i in range(FileScanner.HASH_WORKERS * 4 + 10):
+            (root / f"file{i:03d}.txt").write_text(str(i) * (i + 1))
+
+        scanner.scan(root)
+
+        walk_order = [str(p) for p in scanner.iter_files(root)]
+        with scanner.db._get_connection() as conn:
+            indexed_order = [row["path"] for row in conn.execute("SELECT path FROM files ORDER BY id")]
+        assert indexed_order == walk_order
+
+    def test_dry_run_writes_nothing(self, scanner, source_tree):
+        """A dry run counts files without inserting them."""
+        assert scanner.scan(source_tree, dry_run=True) == 3
+        assert scanner.db.get_all_files() == []
+
+    def test_scan_file_uses_given_stat(self, scanner, source_tree):
+        """scan_file takes size and times from a provided stat result instead of re-stating."""
+        file_path = source_tree / "readme.txt"
+        other_stat = (source_tree / "Documents" / "letter.txt").stat()
+
+        record = scanner.scan_file(file_path, run_id=1, stat=other_stat)
+        assert record.size == other_stat.st_size
+        assert record.sha256 == hashlib.sha256(b"top level").hexdigest()
+
+    def test_scan_file_missing_returns_none(self, scanner, source_tree):
+        """Files that vanish before they are scanned are skipped."""
+        assert scanner.scan_file(source_tree / "gone.txt", run_id=1) is None